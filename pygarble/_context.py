@@ -0,0 +1,101 @@
+"""
+Per-text features shared by every strategy that scores the same text.
+
+An ensemble runs a dozen strategies over one input, and several of them
+need the same derived forms of it: the diacritic-folded text, the ASCII
+word list, the letter histogram. A TextContext computes each form on
+first use and keeps it, and text_context() hands every strategy the
+same context for the same text, so each form is built once per text.
+The cache only needs to outlive one ensemble or applicable() plus
+predict_proba() pass, so it holds just the last few texts.
+"""
+
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from .strategies._fast_hist import (
+    MIN_COUNT_PASS_LENGTH,
+    ascii_alpha_histogram,
+)
+from .strategies._fast_tokenize import (
+    tokenize_ascii,
+    tokenize_ascii_contractions,
+)
+
+
+def fold_diacritics(text: str) -> str:
+    """Strip combining marks (café -> cafe)."""
+    if text.isascii():
+        # NFKD leaves ASCII unchanged and there are no marks to strip.
+        return text
+    normalized = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in normalized if not unicodedata.combining(c))
+
+
+class TextContext:
+    """Lazily computed views of one text.
+
+    The cached values are shared between strategies and must be treated
+    as read-only.
+    """
+
+    __slots__ = (
+        "text", "_folded", "_words", "_contraction_words", "_char_counts",
+    )
+
+    def __init__(self, text: str):
+        self.text = text
+        self._folded: Optional[str] = None
+        self._words: Optional[Tuple[str, ...]] = None
+        self._contraction_words: Optional[Tuple[str, ...]] = None
+        self._char_counts: Optional[Counter] = None
+
+    @property
+    def folded(self) -> str:
+        """The text with combining marks stripped."""
+        if self._folded is None:
+            self._folded = fold_diacritics(self.text)
+        return self._folded
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """Lowercase runs of ASCII letters."""
+        if self._words is None:
+            self._words = tuple(tokenize_ascii(self.text))
+        return self._words
+
+    @property
+    def contraction_words(self) -> Tuple[str, ...]:
+        """Like words, but contractions ("don't") stay one token."""
+        if self._contraction_words is None:
+            self._contraction_words = tuple(
+                tokenize_ascii_contractions(self.text)
+            )
+        return self._contraction_words
+
+    @property
+    def char_counts(self) -> Counter:
+        """Case-folded counts of the alphabetic characters."""
+        if self._char_counts is None:
+            text = self.text
+            if len(text) >= MIN_COUNT_PASS_LENGTH and text.isascii():
+                self._char_counts = ascii_alpha_histogram(text)
+            else:
+                self._char_counts = Counter(
+                    filter(str.isalpha, text.lower())
+                )
+        return self._char_counts
+
+
+@lru_cache(maxsize=8)
+def text_context(text: str) -> TextContext:
+    """The shared context for text.
+
+    Cached across strategy instances, so an ensemble (or applicable()
+    followed by predict_proba()) derives each feature once per text.
+    Strategies built with cache_size=0 bypass it (see
+    BaseStrategy._context).
+    """
+    return TextContext(text)
@@ -1,6 +1,6 @@
 import concurrent.futures
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from .strategies import (
     BaseStrategy,
@@ -123,12 +123,18 @@ class GarbleDetector:
     def _process_text_proba(self, text: str) -> float:
         return self._strategy_instance.predict_proba(text)
 
-    def _process_text_predict(self, text: str) -> bool:
+    @staticmethod
+    def _label(text: str, proba: float, threshold: float) -> bool:
         # Empty/whitespace text is never garbled, even at threshold=0.0.
-        if not text or not text.strip():
-            return False
+        return bool(text.strip()) and proba >= threshold
+
+    def _process_text_predict(self, text: str) -> bool:
+        return self.predict_with_proba(text)[0]
+
+    def predict_with_proba(self, text: str) -> Tuple[bool, float]:
+        """Label and score for one text from a single scoring pass."""
         proba = self._strategy_instance.predict_proba(text)
-        return proba >= self.threshold
+        return self._label(text, proba, self.threshold), proba
 
     def applicable(self, text: str) -> bool:
         return self._strategy_instance.applicable(text)
@@ -142,12 +148,16 @@ class GarbleDetector:
                     f"{type(text).__name__}"
                 )
 
+    def _use_threads(self, texts: List[str]) -> bool:
+        return (
+            self.threads is not None and self.threads > 1 and len(texts) >= 10
+        )
+
     def _process_batch_threaded(
         self, texts: List[str], process_func: Callable[[str], Any]
     ) -> List[Any]:
-        if self.threads is None or self.threads <= 1 or len(texts) < 10:
-            return [process_func(text) for text in texts]
-
+        # Callers only get here when _use_threads(texts) holds.
+        assert self.threads is not None
         max_workers = min(self.threads, len(texts))
         timeout_per_text = self.kwargs.get("timeout_per_text", 30.0)
 
@@ -176,7 +186,15 @@ class GarbleDetector:
             return self._process_text_predict(X)
         elif isinstance(X, list):
             self._validate_batch(X)
-            return self._process_batch_threaded(X, self._process_text_predict)
+            if self._use_threads(X):
+                return self._process_batch_threaded(
+                    X, self._process_text_predict
+                )
+            probas = self._strategy_instance.predict_proba_batch(X)
+            return [
+                self._label(text, proba, self.threshold)
+                for text, proba in zip(X, probas)
+            ]
         else:
             raise TypeError("Input must be a string or list of strings")
 
@@ -187,7 +205,11 @@ class GarbleDetector:
             return self._strategy_instance.predict_proba(X)
         elif isinstance(X, list):
             self._validate_batch(X)
-            return self._process_batch_threaded(X, self._process_text_proba)
+            if self._use_threads(X):
+                return self._process_batch_threaded(
+                    X, self._process_text_proba
+                )
+            return self._strategy_instance.predict_proba_batch(X)
         else:
             raise TypeError("Input must be a string or list of strings")
 
@@ -0,0 +1,55 @@
+"""
+Byte-level tokenization helpers shared by the word-level strategies.
+
+Scanning text with ``re.findall(r"[a-zA-Z]+", text.lower())`` walks the
+string twice: once to lowercase it and once in the regex engine. Here
+lowercasing and classification happen in a single ``bytes.translate``
+pass: ASCII letters map to their lowercase form and every other byte
+maps to a space, so ``split()`` yields the letter runs directly.
+"""
+
+from typing import List
+
+# Byte -> lowercase letter for A-Z/a-z, space for everything else.
+_ALPHA_FOLD_TABLE = bytes(
+    c | 0x20 if 0x41 <= (c & 0xDF) <= 0x5A else 0x20 for c in range(256)
+)
+# Same, but apostrophes survive so contractions stay one token.
+_CONTRACTION_FOLD_TABLE = bytes(
+    c if c == 0x27 else b for c, b in enumerate(_ALPHA_FOLD_TABLE)
+)
+
+
+def tokenize_ascii(text: str) -> List[str]:
+    """Lowercase runs of ASCII letters in text.
+
+    Equivalent to ``re.findall(r"[a-zA-Z]+", text.lower())``. Non-ASCII
+    characters act as separators; they are lowercased first because a
+    few of them (e.g. the Kelvin sign) lowercase to ASCII letters.
+    """
+    if not text.isascii():
+        text = text.lower()
+    folded = text.encode("ascii", "replace").translate(_ALPHA_FOLD_TABLE)
+    return folded.decode("ascii").split()
+
+
+def tokenize_ascii_contractions(text: str) -> List[str]:
+    """Like tokenize_ascii, but apostrophes inside a word are kept.
+
+    Equivalent to stripping leading/trailing apostrophes from each match
+    of ``[a-zA-Z']+`` in ``text.lower()`` and dropping empty tokens, so
+    "don't" stays whole while quoted 'words' lose their quotes.
+    """
+    if not text.isascii():
+        text = text.lower()
+    folded = text.encode("ascii", "replace")
+    folded = folded.translate(_CONTRACTION_FOLD_TABLE)
+    tokens = folded.decode("ascii").split()
+    if b"'" not in folded:
+        return tokens
+    return [t for t in (token.strip("'") for token in tokens) if t]
+
+
+def is_ascii_alpha_run(token: str) -> bool:
+    """True if token is non-empty and made only of ASCII letters."""
+    return token.isascii() and token.isalpha()
@@ -6,11 +6,31 @@ and suffixes (-tion, -ing, -ly, -ness). Garbled text rarely produces
 words with these patterns.
 """
 
-import re
-from typing import Any, List
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
 
 from .base import BaseStrategy
 
+# Trie key marking that the path from the root spells a complete affix.
+# The empty string can never collide with a single-character edge.
+_ACCEPT = ""
+
+
+def _build_anchored_trie(affixes: Iterable[str]) -> Dict[str, Any]:
+    """Goto-trie of affixes for matching anchored at the word start.
+
+    This is the goto function of an Aho-Corasick automaton; anchored
+    matching never needs failure links, so a walk ends at the first
+    missing edge.
+    """
+    root: Dict[str, Any] = {}
+    for affix in affixes:
+        node = root
+        for char in affix:
+            node = node.setdefault(char, {})
+        node[_ACCEPT] = True
+    return root
+
 
 class AffixDetectionStrategy(BaseStrategy):
     """
@@ -65,6 +85,10 @@ class AffixDetectionStrategy(BaseStrategy):
         "al", "ial", "ary", "ory",
     )
 
+    # Shared by every instance; suffixes are stored reversed.
+    _PREFIX_TRIE = _build_anchored_trie(PREFIXES)
+    _SUFFIX_TRIE = _build_anchored_trie(s[::-1] for s in SUFFIXES)
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
         self.min_affix_ratio = kwargs.get("min_affix_ratio", 0.2)
@@ -77,10 +101,16 @@ class AffixDetectionStrategy(BaseStrategy):
         if self.min_word_length < 2:
             raise ValueError("min_word_length must be at least 2")
 
+        self._min_length = self._min_text_length(
+            self.min_analyzable_words, self.min_word_length
+        )
+
     def _tokenize(self, text: str) -> List[str]:
         """Extract lowercase alphabetic words meeting minimum length."""
-        words = re.findall(r"[a-zA-Z]+", text.lower())
-        return [w for w in words if len(w) >= self.min_word_length]
+        return [
+            w for w in self._alpha_words(text)
+            if len(w) >= self.min_word_length
+        ]
 
     @staticmethod
     def _plausible_stem(stem: str) -> bool:
@@ -89,19 +119,40 @@ class AffixDetectionStrategy(BaseStrategy):
         return any(c in "aeiouy" for c in stem)
 
     def _has_prefix(self, word: str) -> bool:
-        """Check if word starts with a known prefix with sufficient stem."""
-        for prefix in self.PREFIXES:
-            if word.startswith(prefix) and len(word) - len(prefix) >= self.min_stem_length:
-                if self._plausible_stem(word[len(prefix):]):
-                    return True
+        """Check if word starts with a known prefix with sufficient stem.
+
+        One walk down the prefix trie visits every matching prefix
+        (e.g. both "un" and "under"), so any of them can supply a
+        plausible stem.
+        """
+        if not word.startswith(self.PREFIXES):
+            return False
+        node = self._PREFIX_TRIE
+        # A negative min_stem_length must not walk past the word's end
+        max_affix_length = min(len(word), len(word) - self.min_stem_length)
+        for depth in range(max_affix_length):
+            child: Optional[Dict[str, Any]] = node.get(word[depth])
+            if child is None:
+                return False
+            node = child
+            if _ACCEPT in node and self._plausible_stem(word[depth + 1:]):
+                return True
         return False
 
     def _has_suffix(self, word: str) -> bool:
-        """Check if word ends with a known suffix with sufficient stem."""
-        for suffix in self.SUFFIXES:
-            if word.endswith(suffix) and len(word) - len(suffix) >= self.min_stem_length:
-                if self._plausible_stem(word[:-len(suffix)]):
-                    return True
+        """Check if word ends with a known suffix with sufficient stem.
+
+        Walks the word backwards through the trie of reversed suffixes.
+        """
+        node = self._SUFFIX_TRIE
+        max_affix_length = min(len(word), len(word) - self.min_stem_length)
+        for depth in range(1, max_affix_length + 1):
+            child: Optional[Dict[str, Any]] = node.get(word[-depth])
+            if child is None:
+                return False
+            node = child
+            if _ACCEPT in node and self._plausible_stem(word[:-depth]):
+                return True
         return False
 
     def _has_affix(self, word: str) -> bool:
@@ -110,15 +161,28 @@ class AffixDetectionStrategy(BaseStrategy):
 
     def applicable(self, text: str) -> bool:
         """Affix statistics need a minimum number of analyzable words."""
-        return len(self._tokenize(text)) >= self.min_analyzable_words
+        return (
+            len(text) >= self._min_length
+            and len(self._tokenize(text)) >= self.min_analyzable_words
+        )
 
     def _predict_proba_impl(self, text: str) -> float:
+        if len(text) < self._min_length:
+            return 0.0
+
         words = self._tokenize(text)
 
         if len(words) < self.min_analyzable_words:
             return 0.0
 
-        affix_count = sum(1 for w in words if self._has_affix(w))
+        # Affix checks depend only on the word, so each distinct word is
+        # walked once and weighted by its count; prose repeats most of
+        # its vocabulary.
+        has_affix = self._has_affix
+        affix_count = sum(
+            count for word, count in Counter(words).items()
+            if has_affix(word)
+        )
         ratio = affix_count / len(words)
 
         if ratio >= self.min_affix_ratio:
@@ -1,8 +1,11 @@
 import re
-import unicodedata
+import threading
 from abc import ABC, abstractmethod
-from collections import Counter
-from typing import Any, Dict
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .._context import TextContext, fold_diacritics, text_context
+from ._fast_tokenize import is_ascii_alpha_run
 
 # Pre-compiled regex for performance
 _WHITESPACE_PATTERN = re.compile(r"\s")
@@ -13,9 +16,56 @@ _URL_PREFIXES = ("http://", "https://", "ftp://", "file://", "data:", "www.")
 
 
 class BaseStrategy(ABC):
+    # Longer texts are scored but not memoized, so neither the score cache
+    # nor the shared TextContext cache pins large documents in memory.
+    CACHE_MAX_TEXT_LENGTH = 10_000
+
     def __init__(self, **kwargs: Any):
         self.kwargs: Dict[str, Any] = kwargs
 
+        # Scores are a pure function of the text for a configured
+        # instance, so repeated texts (ensembles, threshold sweeps,
+        # duplicate rows) are answered from a per-instance LRU cache.
+        self._cache_size = kwargs.get("cache_size", 1024)
+        if self._cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self._init_cache()
+
+    def _init_cache(self) -> None:
+        self._proba_cache: Optional["OrderedDict[str, float]"] = (
+            OrderedDict() if self._cache_size else None
+        )
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks can't be pickled, and cached scores aren't worth shipping
+        # to worker processes; the copy starts with an empty cache.
+        state = self.__dict__.copy()
+        del state["_proba_cache"], state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_cache()
+
+    def _cached_proba(self, text: str) -> float:
+        cache = self._proba_cache
+        if cache is None or len(text) > self.CACHE_MAX_TEXT_LENGTH:
+            return self._predict_proba_impl(text)
+
+        with self._cache_lock:
+            if text in cache:
+                cache.move_to_end(text)
+                return cache[text]
+
+        # Score outside the lock so threads don't serialize on it.
+        proba = self._predict_proba_impl(text)
+        with self._cache_lock:
+            cache[text] = proba
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return proba
+
     def predict(self, text: str) -> bool:
         self._validate_input(text)
         if not text or not text.strip():
@@ -34,7 +84,16 @@ class BaseStrategy(ABC):
         if self._is_extremely_long_string(text):
             return 1.0
 
-        return self._predict_proba_impl(text)
+        return self._cached_proba(text)
+
+    def predict_proba_batch(self, texts: List[str]) -> List[float]:
+        """Score many texts in one call.
+
+        The default loops over predict_proba; a strategy with a cheaper
+        whole-batch formulation can override this, and GarbleDetector
+        routes unthreaded list input through it.
+        """
+        return [self.predict_proba(text) for text in texts]
 
     def applicable(self, text: str) -> bool:
         """Whether this strategy can render a meaningful judgment on text.
@@ -58,16 +117,39 @@ class BaseStrategy(ABC):
             return False
         return not text.lower().startswith(_URL_PREFIXES)
 
-    @staticmethod
-    def _fold_diacritics(text: str) -> str:
+    def _context(self, text: str) -> TextContext:
+        """The TextContext shared by strategies scoring text, or a
+        private one when caching is disabled (cache_size=0) or the text
+        is too long to keep alive."""
+        if self._cache_size and len(text) <= self.CACHE_MAX_TEXT_LENGTH:
+            return text_context(text)
+        return TextContext(text)
+
+    def _fold_diacritics(self, text: str) -> str:
         """Strip combining marks so ASCII n-gram models can score accented
         text (café -> cafe) instead of treating every accented n-gram as
-        unseen."""
-        normalized = unicodedata.normalize("NFKD", text)
-        return "".join(c for c in normalized if not unicodedata.combining(c))
+        unseen. Shared per text through its TextContext."""
+        return self._context(text).folded
+
+    def _alpha_words(self, text: str) -> Tuple[str, ...]:
+        """Lowercase runs of ASCII letters, shared per text through its
+        TextContext so the word-level strategies don't each re-scan the
+        same input."""
+        return self._context(text).words
+
+    @staticmethod
+    def _min_text_length(word_count: int, min_word_length: int = 1) -> int:
+        """Fewest characters that can hold word_count words of at least
+        min_word_length letters, with a separator between each pair.
+
+        Every character yields at most one ASCII letter, even after
+        lowercasing, so a shorter text cannot reach word_count words and
+        a word-level strategy can skip tokenizing it.
+        """
+        return word_count * (max(min_word_length, 1) + 1) - 1
 
     def _get_alpha_char_counts(self, text: str) -> Counter:
-        return Counter(c for c in text.lower() if c.isalpha())
+        return self._context(text).char_counts
 
     def _novel_words(self, text: str, skip_titlecase: bool = False) -> list:
         """Lowercased alphabetic words that cannot be vouched for: not in
@@ -84,16 +166,24 @@ class BaseStrategy(ABC):
 
         novel = []
         for token in text.split():
-            if any(ch.isdigit() for ch in token):
-                continue
-            lower = token.lower()
-            if "://" in lower or "@" in lower or lower.startswith("www."):
-                continue
-            alpha = "".join(
-                c for c in self._fold_diacritics(token) if c.isalpha()
-            )
-            if not alpha:
-                continue
+            if is_ascii_alpha_run(token):
+                # Nothing to fold or strip, and no digits or URL markers.
+                alpha = token
+            else:
+                if any(ch.isdigit() for ch in token):
+                    continue
+                lower = token.lower()
+                if (
+                    "://" in lower
+                    or "@" in lower
+                    or lower.startswith("www.")
+                ):
+                    continue
+                alpha = "".join(
+                    c for c in fold_diacritics(token) if c.isalpha()
+                )
+                if not alpha:
+                    continue
             if token.isupper() and len(alpha) <= 6:
                 continue
             if (
@@ -111,7 +201,7 @@ class BaseStrategy(ABC):
     def _predict_impl(self, text: str) -> bool:
         # Single source of truth: predict agrees with predict_proba unless a
         # strategy has a documented reason to override.
-        return self._predict_proba_impl(text) >= 0.5
+        return self._cached_proba(text) >= 0.5
 
     @abstractmethod
     def _predict_proba_impl(self, text: str) -> float:
@@ -5,7 +5,6 @@ Natural English text contains ~40-60% function/stop words (the, a, is, etc.).
 Garbled text almost never contains these common short words.
 """
 
-import re
 from typing import Any, List
 
 from .base import BaseStrategy
@@ -83,22 +82,34 @@ class FunctionWordDensityStrategy(BaseStrategy):
         if self.min_words < 1:
             raise ValueError("min_words must be at least 1")
 
+        self._min_length = self._min_text_length(
+            self.min_words, self.min_word_length
+        )
+
     def _tokenize(self, text: str) -> List[str]:
         """Extract lowercase alphabetic words."""
-        words = re.findall(r"[a-zA-Z]+", text.lower())
-        return [w for w in words if len(w) >= self.min_word_length]
+        return [
+            w for w in self._alpha_words(text)
+            if len(w) >= self.min_word_length
+        ]
 
     def applicable(self, text: str) -> bool:
         """Abstain on texts with too few analyzable words."""
-        return len(self._tokenize(text)) >= self.min_words
+        return (
+            len(text) >= self._min_length
+            and len(self._tokenize(text)) >= self.min_words
+        )
 
     def _predict_proba_impl(self, text: str) -> float:
+        if len(text) < self._min_length:
+            return 0.0
+
         words = self._tokenize(text)
 
         if len(words) < self.min_words:
             return 0.0
 
-        function_count = sum(1 for w in words if w in self.FUNCTION_WORDS)
+        function_count = sum(map(self.FUNCTION_WORDS.__contains__, words))
         ratio = function_count / len(words)
 
         # Only zero function words across >= 10 words is strong enough
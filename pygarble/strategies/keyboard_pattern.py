@@ -24,6 +24,9 @@ COMMON_TRIGRAMS: Set[str] = {
     "sta", "cti", "ica", "ist", "ear", "ain", "one", "our", "iti", "rat",
 }
 
+# A letter pair repeated three or more times in a row ("ababab").
+_REPEATED_BIGRAM_PATTERN = re.compile(r"(..)(\1){2,}")
+
 
 class KeyboardPatternStrategy(BaseStrategy):
     def _get_trigrams(self, text: str) -> List[str]:
@@ -59,8 +62,7 @@ class KeyboardPatternStrategy(BaseStrategy):
         if len(alpha_text) < 6:
             return False
 
-        pattern = r"(..)(\1){2,}"
-        return bool(re.search(pattern, alpha_text))
+        return bool(_REPEATED_BIGRAM_PATTERN.search(alpha_text))
 
     def _predict_proba_impl(self, text: str) -> float:
         keyboard_ratio = self._get_keyboard_pattern_ratio(text)
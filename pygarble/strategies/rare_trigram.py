@@ -10,6 +10,8 @@ import re
 
 from .base import BaseStrategy
 
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
 
 class RareTrigramStrategy(BaseStrategy):
     """
@@ -86,7 +88,7 @@ class RareTrigramStrategy(BaseStrategy):
         # Tokenize into words: trigrams must not cross word boundaries,
         # otherwise adjacent innocent words form phantom "impossible"
         # trigrams (e.g. "visit www" -> "tww").
-        words = re.findall(r"[a-z]+", self._fold_diacritics(text).lower())
+        words = _WORD_PATTERN.findall(self._fold_diacritics(text).lower())
 
         alpha_length = sum(len(w) for w in words)
         if alpha_length < self.min_length:
@@ -10,6 +10,9 @@ from typing import Any
 
 from .base import BaseStrategy
 
+# A run of three or more of the same symbol, e.g. "----" or "===="
+_SYMBOL_RUN_PATTERN = re.compile(r"([^\w\s])\1{2,}")
+
 
 class SymbolRatioStrategy(BaseStrategy):
     """
@@ -74,7 +77,7 @@ class SymbolRatioStrategy(BaseStrategy):
 
         # A run of one repeated symbol ("----", "====") is formatting,
         # not garble; collapse it before measuring density
-        text = re.sub(r"([^\w\s])\1{2,}", r"\1", text)
+        text = _SYMBOL_RUN_PATTERN.sub(r"\1", text)
 
         # Count characters
         total = 0
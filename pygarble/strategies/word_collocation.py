@@ -6,12 +6,25 @@ like "of the", "in the", "it is". Garbled text almost never produces
 these common pairings.
 """
 
-import re
-from typing import Any, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Set, Tuple
 
 from .base import BaseStrategy
 
 
+def _followers_by_first_word(
+    pairs: Iterable[Tuple[str, str]],
+) -> Dict[str, FrozenSet[str]]:
+    """Index collocations by their first word.
+
+    Only ~130 words ever start a collocation, so a single dict miss
+    dismisses most tokens before any second-word probe.
+    """
+    followers: Dict[str, Set[str]] = {}
+    for first, second in pairs:
+        followers.setdefault(first, set()).add(second)
+    return {first: frozenset(seconds) for first, seconds in followers.items()}
+
+
 class WordCollocationStrategy(BaseStrategy):
     """
     Detect garbled text by checking for common English word bigrams.
@@ -161,6 +174,8 @@ class WordCollocationStrategy(BaseStrategy):
         ("that", "we"), ("that", "you"),
     })
 
+    _FOLLOWERS = _followers_by_first_word(COMMON_COLLOCATIONS)
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
         self.min_words = kwargs.get("min_words", 8)
@@ -171,15 +186,17 @@ class WordCollocationStrategy(BaseStrategy):
         if self.min_words < 2:
             raise ValueError("min_words must be at least 2")
 
-    def _tokenize(self, text: str) -> List[str]:
+        self._min_length = self._min_text_length(self.min_words)
+
+    def _tokenize(self, text: str) -> Tuple[str, ...]:
         """Extract lowercase alphabetic words.
 
         Apostrophes are kept inside tokens so contractions
         ("don't", "it's") stay one word instead of splitting into
-        fragments that can never match a collocation.
+        fragments that can never match a collocation. Shared per text
+        through its TextContext.
         """
-        tokens = re.findall(r"[a-zA-Z']+", text.lower())
-        return [t.strip("'") for t in tokens if t.strip("'")]
+        return self._context(text).contraction_words
 
     def _title_case_ratio(self, text: str) -> float:
         """Ratio of tokens whose first letter is uppercase.
@@ -202,15 +219,10 @@ class WordCollocationStrategy(BaseStrategy):
                     break
         return titled / len(tokens)
 
-    def _get_bigrams(
-        self, words: List[str]
-    ) -> List[Tuple[str, str]]:
-        """Generate adjacent word pairs."""
-        return [
-            (words[i], words[i + 1]) for i in range(len(words) - 1)
-        ]
-
     def _predict_proba_impl(self, text: str) -> float:
+        if len(text) < self._min_length:
+            return 0.0
+
         words = self._tokenize(text)
 
         if len(words) < self.min_words:
@@ -222,15 +234,19 @@ class WordCollocationStrategy(BaseStrategy):
         if substantial < self.min_words // 2:
             return 0.0
 
-        bigrams = self._get_bigrams(words)
-        if not bigrams:
-            return 0.0
-
-        hit_count = sum(
-            1 for bg in bigrams if bg in self.COMMON_COLLOCATIONS
-        )
-        total_bigrams = len(bigrams)
-        hit_ratio = hit_count / total_bigrams
+        # Stop at the first hit that settles the text as natural: any
+        # collocation clears short text, long text needs a 2% hit rate.
+        long_text = len(words) >= 15
+        total_bigrams = len(words) - 1
+        followers_of = self._FOLLOWERS.get
+        hit_count = 0
+        followers = None
+        for word in words:
+            if followers is not None and word in followers:
+                hit_count += 1
+                if not long_text or hit_count / total_bigrams >= 0.02:
+                    return 0.0
+            followers = followers_of(word)
 
         # Zero collocations: scale with text length
         if hit_count == 0:
@@ -246,11 +262,11 @@ class WordCollocationStrategy(BaseStrategy):
             return 0.3
 
         # Very low collocation rate in long text
-        if len(words) >= 15 and hit_ratio < 0.02:
-            return 0.55
-
-        return 0.0
+        return 0.55
 
     def applicable(self, text: str) -> bool:
         """Word-pair statistics need a minimum amount of text."""
-        return len(self._tokenize(text)) >= self.min_words
+        return (
+            len(text) >= self._min_length
+            and len(self._tokenize(text)) >= self.min_words
+        )
@@ -11,6 +11,9 @@ from typing import Any, List
 from .base import BaseStrategy
 from ..data import ENGLISH_WORDS
 
+# Pre-compiled regex for performance
+_WORD_PATTERN = re.compile(r"[a-zA-Z]+")
+
 
 class WordLookupStrategy(BaseStrategy):
     """
@@ -58,7 +61,7 @@ class WordLookupStrategy(BaseStrategy):
         at the accent.
         """
         folded = self._fold_diacritics(text)
-        words = re.findall(r"[a-zA-Z]+", folded)
+        words = _WORD_PATTERN.findall(folded)
         # Filter by minimum length
         return [w for w in words if len(w) >= self.min_word_length]
 
@@ -6,9 +6,8 @@ Garbled text produces flat distributions where every "word" appears once.
 Uses Type-Token Ratio and hapax legomena ratio as primary signals.
 """
 
-import re
 from collections import Counter
-from typing import Any, List
+from typing import Any, Sequence
 
 from .base import BaseStrategy
 from .function_word_density import FunctionWordDensityStrategy
@@ -52,6 +51,9 @@ class ZipfConformityStrategy(BaseStrategy):
     # evidence of gibberish (kept below the 0.5 decision boundary).
     UNCORROBORATED_CAP = 0.45
 
+    # Leading words whose distinct count bounds the TTR of long texts.
+    TTR_SAMPLE_WORDS = 64
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
         self.min_words = kwargs.get("min_words", 30)
@@ -65,49 +67,74 @@ class ZipfConformityStrategy(BaseStrategy):
         if not 0.0 <= self.hapax_threshold <= 1.0:
             raise ValueError("hapax_threshold must be between 0.0 and 1.0")
 
-    def _tokenize(self, text: str) -> List[str]:
+        # Hapax words are a subset of distinct words, so hapax_ratio <=
+        # ttr: a TTR below 1.0 and at or below both thresholds fires
+        # neither component and the score is 0.0.
+        self._dead_ttr = min(self.ttr_threshold, self.hapax_threshold)
+        self._min_length = self._min_text_length(self.min_words)
+
+    def _tokenize(self, text: str) -> Sequence[str]:
         """Extract lowercase alphabetic words."""
-        return re.findall(r"[a-zA-Z]+", text.lower())
+        return self._alpha_words(text)
 
     def applicable(self, text: str) -> bool:
         """Abstain on texts with too few words for distribution stats."""
-        return len(self._tokenize(text)) >= self.min_words
+        return (
+            len(text) >= self._min_length
+            and len(self._tokenize(text)) >= self.min_words
+        )
 
     @staticmethod
-    def _corroborated(words: List[str]) -> bool:
+    def _corroborated(words: Sequence[str]) -> bool:
         """
         Check for independent evidence that a flat word distribution is
         actually gibberish rather than a legitimate list of distinct
         real words (names, ingredients, keywords, ...).
         """
-        if any(
-            w in FunctionWordDensityStrategy.FUNCTION_WORDS for w in words
-        ):
+        if not FunctionWordDensityStrategy.FUNCTION_WORDS.isdisjoint(words):
             return False
-        unknown = sum(1 for w in words if w not in ENGLISH_WORDS)
-        return unknown / len(words) >= 0.5
+        known = sum(map(ENGLISH_WORDS.__contains__, words))
+        return (len(words) - known) / len(words) >= 0.5
 
     def _predict_proba_impl(self, text: str) -> float:
+        if len(text) < self._min_length:
+            return 0.0
+
         words = self._tokenize(text)
 
         if len(words) < self.min_words:
             return 0.0
 
-        word_counts = Counter(words)
         total_words = len(words)
-        unique_words = len(word_counts)
+        dead_ttr = self._dead_ttr
+
+        # Each word after the sample adds at most one new type, so a
+        # repetitive opening bounds the TTR without hashing every word.
+        sample_size = self.TTR_SAMPLE_WORDS
+        if total_words > 2 * sample_size:
+            max_unique = len(set(words[:sample_size])) + (
+                total_words - sample_size
+            )
+            if (
+                max_unique < total_words
+                and max_unique / total_words <= dead_ttr
+            ):
+                return 0.0
+
+        unique_words = len(set(words))
         ttr = unique_words / total_words
-
-        # Hapax legomena: words appearing exactly once
-        hapax_count = sum(
-            1 for count in word_counts.values() if count == 1
-        )
-        hapax_ratio = hapax_count / total_words
+        if unique_words < total_words and ttr <= dead_ttr:
+            return 0.0
 
         # Perfect uniqueness: every word appears exactly once
         if ttr == 1.0:
             score = 0.9
         else:
+            # Hapax legomena: words appearing exactly once. Only needed
+            # here, so all-unique texts skip the counting pass.
+            hapax_count = list(Counter(words).values()).count(1)
+            hapax_ratio = hapax_count / total_words
+
             score = 0.0
 
             # TTR component
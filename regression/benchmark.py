@@ -1,17 +1,32 @@
 #!/usr/bin/env python
 import json
+import multiprocessing
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import compress, islice
+from operator import countOf, itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pygarble import GarbleDetector, Strategy, EnsembleDetector
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON output
+    orjson = None
 
-STRATEGIES = [
+try:
+    import ijson
+except ImportError:  # optional: streaming parse of large test-case files
+    ijson = None
+
+
+STRATEGIES = (
     # New strategies (v0.3.0)
     Strategy.MARKOV_CHAIN,
     Strategy.NGRAM_FREQUENCY,
@@ -44,112 +59,117 @@ STRATEGIES = [
     Strategy.ENTROPY_BASED,
     Strategy.VOWEL_RATIO,
     Strategy.KEYBOARD_PATTERN,
-]
+)
 
 # Strategies that require optional dependencies (excluded by default)
-OPTIONAL_STRATEGIES = []
+OPTIONAL_STRATEGIES = ()
 
+# Below this many (case, strategy) predictions, run_benchmark stays single-process
+PARALLEL_MIN_WORK = 500
 
-def load_test_cases(json_path: str) -> List[Dict[str, Any]]:
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+# strategy value -> {text: score}. Scores don't depend on the threshold, so
+# repeated run_benchmark calls in one process (threshold sweeps) reuse them.
+_SCORE_CACHE: Dict[str, Dict[str, float]] = {}
+
+
+# Test-case files at least this large are streamed with ijson when available
+STREAM_MIN_BYTES = 1_000_000
+
+
+def _iter_categories(json_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of the file's "test_cases" array.
 
+    Large files are parsed one category at a time with ijson, so peak memory
+    stays near one category rather than the whole document tree.
+    """
+    if ijson is not None and os.path.getsize(json_path) >= STREAM_MIN_BYTES:
+        with open(json_path, "rb") as f:
+            yield from ijson.items(f, "test_cases.item")
+    else:
+        with open(json_path, "r", encoding="utf-8") as f:
+            yield from json.load(f)["test_cases"]
+
+
+def load_test_cases(json_path: str) -> List[Dict[str, Any]]:
     all_cases = []
-    for category_data in data["test_cases"]:
+    for category_data in _iter_categories(json_path):
         category = category_data["category"]
         source = category_data.get("source", "internal")
         for case in category_data["cases"]:
+            text = case["text"]
             all_cases.append({
                 "category": category,
                 "source": source,
-                "text": case["text"],
+                "text": text,
+                # Truncated form used in reports, computed once per case
+                "display_text": text[:50] + "..." if len(text) > 50 else text,
                 "expected": case["expected_garbled"]
             })
     return all_cases
 
 
-def run_benchmark(test_cases: List[Dict[str, Any]], threshold: float = 0.5, include_optional: bool = False) -> Dict[str, Any]:
-    results = {}
+class Prediction(NamedTuple):
+    """One strategy's outcome on one case, as shown in the report."""
 
-    strategies_to_run = STRATEGIES.copy()
-    if include_optional:
-        strategies_to_run.extend(OPTIONAL_STRATEGIES)
+    display_text: str
+    category: str
+    source: str
+    expected: bool
+    predicted: bool
 
-    for strategy in strategies_to_run:
-        strategy_name = strategy.value
-        detector = GarbleDetector(strategy, threshold=threshold)
-        
-        predictions = []
-        start_time = time.perf_counter()
-        
-        for case in test_cases:
-            pred = detector.predict(case["text"])
-            predictions.append({
-                "text": case["text"][:50] + "..." if len(case["text"]) > 50 else case["text"],
-                "category": case["category"],
-                "source": case["source"],
-                "expected": case["expected"],
-                "predicted": pred,
-                "correct": pred == case["expected"]
-            })
-        
-        elapsed_time = time.perf_counter() - start_time
-        
-        correct = sum(1 for p in predictions if p["correct"])
-        total = len(predictions)
-        
-        true_positives = sum(1 for p in predictions if p["expected"] and p["predicted"])
-        false_positives = sum(1 for p in predictions if not p["expected"] and p["predicted"])
-        true_negatives = sum(1 for p in predictions if not p["expected"] and not p["predicted"])
-        false_negatives = sum(1 for p in predictions if p["expected"] and not p["predicted"])
-        
-        precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
-        recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
-        f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-        
-        results[strategy_name] = {
-            "accuracy": correct / total,
-            "precision": precision,
-            "recall": recall,
-            "f1_score": f1,
-            "true_positives": true_positives,
-            "false_positives": false_positives,
-            "true_negatives": true_negatives,
-            "false_negatives": false_negatives,
-            "total_cases": total,
-            "time_seconds": elapsed_time,
-            "predictions": predictions
-        }
-    
-    ensemble = EnsembleDetector(threshold=threshold)
-    predictions = []
+
+def _prediction(case: Dict[str, Any], predicted: bool) -> Prediction:
+    """Rebuild a report row from a test case and its parallel prediction."""
+    return Prediction(
+        case["display_text"], case["category"], case.get("source", "unknown"), case["expected"], predicted
+    )
+
+
+def _confusion_counts(expected: List[bool], predicted: List[bool]) -> Tuple[int, int, int, int]:
+    """(TP, FP, TN, FN) for parallel lists of expected and predicted labels."""
+    tp = sum(compress(predicted, expected))
+    fp = predicted.count(True) - tp
+    fn = expected.count(True) - tp
+    tn = len(expected) - tp - fp - fn
+    return tp, fp, tn, fn
+
+
+def _score_texts(args) -> Tuple[Any, Dict[str, Any], float]:
+    """Score texts with one strategy, or label them with the ensemble when
+    strategy is None. Returns the strategy, {text: output}, and the seconds taken.
+
+    Top-level and taking a single tuple so it can be mapped over a process pool.
+    Workers only see their arguments (under spawn they don't share
+    _SCORE_CACHE), so callers pass just the texts that still need scoring.
+    """
+    strategy, texts, threshold = args
     start_time = time.perf_counter()
-    
-    for case in test_cases:
-        pred = ensemble.predict(case["text"])
-        predictions.append({
-            "text": case["text"][:50] + "..." if len(case["text"]) > 50 else case["text"],
-            "category": case["category"],
-            "source": case["source"],
-            "expected": case["expected"],
-            "predicted": pred,
-            "correct": pred == case["expected"]
-        })
-    
-    elapsed_time = time.perf_counter() - start_time
-    correct = sum(1 for p in predictions if p["correct"])
-    total = len(predictions)
-    
-    true_positives = sum(1 for p in predictions if p["expected"] and p["predicted"])
-    false_positives = sum(1 for p in predictions if not p["expected"] and p["predicted"])
-    true_negatives = sum(1 for p in predictions if not p["expected"] and not p["predicted"])
-    false_negatives = sum(1 for p in predictions if p["expected"] and not p["predicted"])
-    
+    if strategy is None:
+        # Voting rules decide the ensemble's label, not a threshold on one
+        # score, so it is always run in full.
+        outputs = EnsembleDetector(threshold=threshold).predict(texts)
+    else:
+        outputs = GarbleDetector(strategy).predict_proba(texts)
+    return strategy, dict(zip(texts, outputs)), time.perf_counter() - start_time
+
+
+def _metrics(
+    test_cases: List[Dict[str, Any]],
+    predicted: List[bool],
+    elapsed_time: Optional[float],
+    collect_predictions: bool,
+) -> Dict[str, Any]:
+    """Aggregate metrics for one strategy's predictions over test_cases."""
+    expected = [case["expected"] for case in test_cases]
+    total = len(expected)
+    true_positives, false_positives, true_negatives, false_negatives = _confusion_counts(expected, predicted)
+    correct = true_positives + true_negatives
+
     precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
     recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
     f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-    
-    results["ensemble"] = {
+
+    metrics = {
         "accuracy": correct / total,
         "precision": precision,
         "recall": recall,
@@ -160,59 +180,167 @@ def run_benchmark(test_cases: List[Dict[str, Any]], threshold: float = 0.5, incl
         "false_negatives": false_negatives,
         "total_cases": total,
         "time_seconds": elapsed_time,
-        "predictions": predictions
     }
-    
+    if collect_predictions:
+        # Structure of arrays, parallel to test_cases: the per-case fields that
+        # don't vary by strategy (text, category, source, expected) stay there.
+        metrics["predictions"] = {
+            "predicted": predicted,
+            "correct": [pred == exp for pred, exp in zip(predicted, expected)],
+        }
+    return metrics
+
+
+def run_benchmark(
+    test_cases: List[Dict[str, Any]],
+    threshold: float = 0.5,
+    include_optional: bool = False,
+    collect_predictions: bool = True,
+) -> Dict[str, Any]:
+    """Score every strategy and the ensemble over test_cases.
+
+    Per-case predictions are kept under each strategy's "predictions" key for
+    the category/source analyses and the report; pass collect_predictions=False
+    when only the aggregate metrics are needed.
+
+    A strategy's time_seconds is None when any of its scores came from
+    _SCORE_CACHE (a repeated call, e.g. in a threshold sweep).
+    """
+    strategies_to_run = STRATEGIES + (OPTIONAL_STRATEGIES if include_optional else ())
+    texts = [case["text"] for case in test_cases]
+    # Duplicate texts (the same string under several categories) are scored once
+    unique_texts = list(dict.fromkeys(texts))
+
+    # None stands for the ensemble, scored as one more independent task. It is
+    # the slowest task, so it goes first: the pool overlaps it with the
+    # strategies instead of running it alone after they finish. Strategies
+    # whose scores are all cached are not dispatched at all.
+    tasks = [(None, unique_texts, threshold)]
+    for strategy in strategies_to_run:
+        cached = _SCORE_CACHE.get(strategy.value, {})
+        missing = [text for text in unique_texts if text not in cached]
+        if missing:
+            tasks.append((strategy, missing, threshold))
+
+    # Each task builds its own detector over read-only inputs, so they run in
+    # parallel; elapsed time is measured inside the worker and stays per-task.
+    # Small workloads don't repay the pool startup cost.
+    processes = min(len(tasks), os.cpu_count() or 1)
+    if processes > 1 and sum(len(task[1]) for task in tasks) > PARALLEL_MIN_WORK:
+        with multiprocessing.Pool(processes=processes) as pool:
+            scored = list(pool.imap(_score_texts, tasks))
+    else:
+        scored = [_score_texts(task) for task in tasks]
+
+    _, labels, ensemble_time = scored[0]
+    # A strategy reusing cached scores didn't time its scoring, so it reports
+    # no time rather than a misleadingly small one.
+    times: Dict[str, Optional[float]] = {}
+    for strategy, new_scores, elapsed in scored[1:]:
+        _SCORE_CACHE.setdefault(strategy.value, {}).update(new_scores)
+        if len(new_scores) == len(unique_texts):
+            times[strategy.value] = elapsed
+
+    results = {}
+    for strategy in strategies_to_run:
+        scores = _SCORE_CACHE.get(strategy.value, {})
+        # Labeled with GarbleDetector's own rule, from the cached scores
+        predicted = [GarbleDetector._label(text, scores[text], threshold) for text in texts]
+        results[strategy.value] = _metrics(test_cases, predicted, times.get(strategy.value), collect_predictions)
+    # Listing the ensemble last keeps the report's tie-breaking order unchanged
+    predicted = [labels[text] for text in texts]
+    results["ensemble"] = _metrics(test_cases, predicted, ensemble_time, collect_predictions)
     return results
 
 
-def analyze_by_category(results: Dict[str, Any], test_cases: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
-    categories = set(case["category"] for case in test_cases)
+def _per_case_predictions(strategy_name: str, strategy_results: Dict[str, Any]) -> Dict[str, List[bool]]:
+    """The per-case predictions for one strategy's results."""
+    try:
+        return strategy_results["predictions"]
+    except KeyError:
+        raise ValueError(
+            f"no per-case predictions for {strategy_name!r}; "
+            "run run_benchmark with collect_predictions=True"
+        ) from None
+
+
+def _indices_by(test_cases: List[Dict[str, Any]], field: str) -> Dict[str, List[int]]:
+    """Positions of the cases sharing each value of field, in first-seen order.
+
+    The partition is the same for every strategy, so it is built once per
+    analysis rather than re-filtered per strategy.
+    """
+    indices: Dict[str, List[int]] = {}
+    for i, case in enumerate(test_cases):
+        indices.setdefault(case[field], []).append(i)
+    return indices
+
+
+def analyze_by_category(
+    results: Dict[str, Any],
+    test_cases: List[Dict[str, Any]],
+    category_indices: Dict[str, List[int]] = None,
+) -> Tuple[Dict[str, Dict[str, float]], List[str]]:
+    """Per-strategy accuracy for each category, plus the sorted category names.
+
+    category_indices is the _indices_by(test_cases, "category") partition, if
+    the caller already has it.
+    """
+    if category_indices is None:
+        category_indices = _indices_by(test_cases, "category")
     category_analysis = {}
 
     for strategy_name, strategy_results in results.items():
         category_analysis[strategy_name] = {}
-        for category in categories:
-            category_preds = [p for p in strategy_results["predictions"] if p["category"] == category]
-            if category_preds:
-                accuracy = sum(1 for p in category_preds if p["correct"]) / len(category_preds)
-                category_analysis[strategy_name][category] = accuracy
+        correct = _per_case_predictions(strategy_name, strategy_results)["correct"]
+        for category, indices in category_indices.items():
+            accuracy = sum(map(correct.__getitem__, indices)) / len(indices)
+            category_analysis[strategy_name][category] = accuracy
 
-    return category_analysis
+    return category_analysis, sorted(category_indices)
 
 
-def analyze_by_source(results: Dict[str, Any], test_cases: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, float]]]:
-    """Analyze results by source (internal vs external)."""
-    sources = set(case["source"] for case in test_cases)
+def analyze_by_source(
+    results: Dict[str, Any],
+    test_cases: List[Dict[str, Any]],
+    source_indices: Dict[str, List[int]] = None,
+) -> Tuple[Dict[str, Dict[str, Dict[str, float]]], List[str]]:
+    """Analyze results by source (internal vs external), plus the sorted source names.
+
+    source_indices is the _indices_by(test_cases, "source") partition, if the
+    caller already has it.
+    """
+    if source_indices is None:
+        source_indices = _indices_by(test_cases, "source")
+    expected = [case["expected"] for case in test_cases]
     source_analysis = {}
 
     for strategy_name, strategy_results in results.items():
         source_analysis[strategy_name] = {}
-        for source in sources:
-            source_preds = [p for p in strategy_results["predictions"] if p.get("source") == source]
-            if source_preds:
-                correct = sum(1 for p in source_preds if p["correct"])
-                total = len(source_preds)
-
-                tp = sum(1 for p in source_preds if p["expected"] and p["predicted"])
-                fp = sum(1 for p in source_preds if not p["expected"] and p["predicted"])
-                fn = sum(1 for p in source_preds if p["expected"] and not p["predicted"])
-
-                precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-                recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-                f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
-
-                source_analysis[strategy_name][source] = {
-                    "accuracy": correct / total,
-                    "precision": precision,
-                    "recall": recall,
-                    "f1": f1,
-                    "total": total,
-                    "fp": fp,
-                    "fn": fn,
-                }
-
-    return source_analysis
+        predicted = _per_case_predictions(strategy_name, strategy_results)["predicted"]
+        for source, indices in source_indices.items():
+            total = len(indices)
+            tp, fp, tn, fn = _confusion_counts(
+                list(map(expected.__getitem__, indices)),
+                list(map(predicted.__getitem__, indices)),
+            )
+            correct = tp + tn
+
+            precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+            recall = tp / (tp + fn) if (tp + fn) > 0 else 0
+            f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+
+            source_analysis[strategy_name][source] = {
+                "accuracy": correct / total,
+                "precision": precision,
+                "recall": recall,
+                "f1": f1,
+                "total": total,
+                "fp": fp,
+                "fn": fn,
+            }
+
+    return source_analysis, sorted(source_indices)
 
 
 def format_results(
@@ -220,16 +348,26 @@ def format_results(
     category_analysis: Dict[str, Dict[str, float]],
     source_analysis: Dict[str, Dict[str, Dict[str, float]]] = None,
     test_cases: List[Dict[str, Any]] = None,
+    run_timestamp: datetime = None,
+    categories: List[str] = None,
+    sources: List[str] = None,
 ) -> str:
+    """Render the text report.
+
+    categories and sources are the sorted names returned by the analyses; when
+    omitted they are collected from the analysis dicts.
+    """
+    if run_timestamp is None:
+        run_timestamp = datetime.now()
     output = []
     output.append("=" * 80)
     output.append("PYGARBLE BENCHMARK RESULTS")
-    output.append(f"Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    output.append(f"Run Date: {run_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
     output.append("=" * 80)
 
     # Dataset summary
     if test_cases:
-        internal_count = sum(1 for c in test_cases if c.get("source") == "internal")
+        internal_count = countOf(map(itemgetter("source"), test_cases), "internal")
         external_count = len(test_cases) - internal_count
         output.append(f"\nDataset: {len(test_cases)} total cases ({internal_count} internal, {external_count} external)")
 
@@ -240,8 +378,10 @@ def format_results(
     sorted_results = sorted(results.items(), key=lambda x: x[1]["f1_score"], reverse=True)
 
     for strategy_name, metrics in sorted_results:
+        elapsed = metrics["time_seconds"]
+        time_column = f"{elapsed:>10.4f}" if elapsed is not None else f"{'cached':>10}"
         output.append(f"{strategy_name:<25} {metrics['accuracy']:>10.2%} {metrics['precision']:>10.2%} "
-              f"{metrics['recall']:>10.2%} {metrics['f1_score']:>10.2%} {metrics['time_seconds']:>10.4f}")
+              f"{metrics['recall']:>10.2%} {metrics['f1_score']:>10.2%} {time_column}")
 
     output.append("\n### CONFUSION MATRIX SUMMARY ###\n")
     output.append(f"{'Strategy':<25} {'TP':>6} {'FP':>6} {'TN':>6} {'FN':>6}")
@@ -256,7 +396,8 @@ def format_results(
         output.append("\n### METRICS BY DATA SOURCE ###\n")
         output.append("Comparing performance on internal (developed alongside strategies) vs external (unbiased) data:\n")
 
-        sources = sorted(set(src for sa in source_analysis.values() for src in sa))
+        if sources is None:
+            sources = sorted(set(src for sa in source_analysis.values() for src in sa))
 
         for source in sources:
             source_label = source.replace("_", " ").title()
@@ -295,7 +436,8 @@ def format_results(
 
     output.append("\n### ACCURACY BY CATEGORY ###\n")
 
-    categories = sorted(set(cat for cats in category_analysis.values() for cat in cats))
+    if categories is None:
+        categories = sorted(set(cat for cats in category_analysis.values() for cat in cats))
 
     header = f"{'Strategy':<25}" + "".join(f"{cat[:12]:>14}" for cat in categories)
     output.append(header)
@@ -308,23 +450,46 @@ def format_results(
             row += f"{acc:>13.0%} "
         output.append(row)
 
-    output.append("\n### MISCLASSIFIED EXAMPLES (Top 5 per strategy) ###\n")
-
-    for strategy_name, metrics in sorted_results[:3]:
-        misclassified = [p for p in metrics["predictions"] if not p["correct"]][:5]
-        if misclassified:
-            output.append(f"\n{strategy_name}:")
-            for p in misclassified:
-                expected = "garbled" if p["expected"] else "normal"
-                predicted = "garbled" if p["predicted"] else "normal"
-                source_tag = f"[{p.get('source', 'unknown')}]" if p.get('source') != 'internal' else ""
-                output.append(f"  [{p['category']}]{source_tag} \"{p['text']}\"")
-                output.append(f"    Expected: {expected}, Predicted: {predicted}")
+    # Per-case details live in test_cases (predictions are parallel to it).
+    # Results from collect_predictions=False runs have none to show.
+    top_with_predictions = [(name, m) for name, m in sorted_results[:3] if "predictions" in m]
+    if test_cases and top_with_predictions:
+        output.append("\n### MISCLASSIFIED EXAMPLES (Top 5 per strategy) ###\n")
+
+        for strategy_name, metrics in top_with_predictions:
+            predictions = metrics["predictions"]
+            # Stop scanning at the fifth error instead of collecting them all
+            wrong = islice((i for i, ok in enumerate(predictions["correct"]) if not ok), 5)
+            misclassified = [_prediction(test_cases[i], predictions["predicted"][i]) for i in wrong]
+            if misclassified:
+                output.append(f"\n{strategy_name}:")
+                for p in misclassified:
+                    expected = "garbled" if p.expected else "normal"
+                    predicted = "garbled" if p.predicted else "normal"
+                    source_tag = f"[{p.source}]" if p.source != 'internal' else ""
+                    output.append(f"  [{p.category}]{source_tag} \"{p.display_text}\"")
+                    output.append(f"    Expected: {expected}, Predicted: {predicted}")
 
     return "\n".join(output)
 
 
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def _write_text(path: Path, text: str) -> None:
+    with open(path, "w") as f:
+        f.write(text)
+
+
 def main():
+    # One timestamp for the whole run, so the text and JSON reports agree
+    run_timestamp = datetime.now()
     script_dir = Path(__file__).parent
     json_path = script_dir / "benchmark_data.json"
 
@@ -335,50 +500,56 @@ def main():
     print("Loading test cases...")
     test_cases = load_test_cases(str(json_path))
 
-    # Count by source
-    source_counts = {}
-    for case in test_cases:
-        src = case.get("source", "internal")
-        source_counts[src] = source_counts.get(src, 0) + 1
+    # Partitions shared by the source counts and both analyses, built once
+    category_indices = _indices_by(test_cases, "category")
+    source_indices = _indices_by(test_cases, "source")
+    source_counts = {src: len(indices) for src, indices in source_indices.items()}
 
     print(f"Loaded {len(test_cases)} test cases:")
     for src, count in sorted(source_counts.items()):
         print(f"  - {src}: {count}")
 
     print("\nRunning benchmark...")
-    results = run_benchmark(test_cases, threshold=0.5)
+    # The category/source analyses and misclassified examples need predictions
+    results = run_benchmark(test_cases, threshold=0.5, collect_predictions=True)
 
     print("Analyzing by category...")
-    category_analysis = analyze_by_category(results, test_cases)
+    category_analysis, categories = analyze_by_category(results, test_cases, category_indices)
 
     print("Analyzing by source...")
-    source_analysis = analyze_by_source(results, test_cases)
+    source_analysis, sources = analyze_by_source(results, test_cases, source_indices)
 
-    formatted_output = format_results(results, category_analysis, source_analysis, test_cases)
+    formatted_output = format_results(
+        results, category_analysis, source_analysis, test_cases,
+        run_timestamp=run_timestamp, categories=categories, sources=sources,
+    )
     print(formatted_output)
 
     output_json_path = script_dir / "benchmark_results.json"
-    with open(output_json_path, "w") as f:
-        output_data = {
-            "run_date": datetime.now().isoformat(),
-            "threshold": 0.5,
-            "total_test_cases": len(test_cases),
-            "source_counts": source_counts,
-            "strategies": {
-                strategy: {k: v for k, v in metrics.items() if k != "predictions"}
-                for strategy, metrics in results.items()
-            },
-            "category_analysis": category_analysis,
-            "source_analysis": source_analysis,
-        }
-        json.dump(output_data, f, indent=2)
-    print(f"\nJSON results saved to: {output_json_path}")
-
+    output_data = {
+        "run_date": run_timestamp.isoformat(),
+        "threshold": 0.5,
+        "total_test_cases": len(test_cases),
+        "source_counts": source_counts,
+        "strategies": {
+            strategy: {k: v for k, v in metrics.items() if k != "predictions"}
+            for strategy, metrics in results.items()
+        },
+        "category_analysis": category_analysis,
+        "source_analysis": source_analysis,
+    }
     output_txt_path = script_dir / "benchmark_results.txt"
-    with open(output_txt_path, "w") as f:
-        f.write(formatted_output)
-    print(f"Text results saved to: {output_txt_path}")
 
+    # Independent writes; the GIL is released during file I/O, so they overlap
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [
+            executor.submit(_write_json, output_json_path, output_data),
+            executor.submit(_write_text, output_txt_path, formatted_output),
+        ]
+        for write in writes:
+            write.result()  # re-raise any write error
+    print(f"\nJSON results saved to: {output_json_path}")
+    print(f"Text results saved to: {output_txt_path}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,18 @@
+import pytest
+
+from pygarble import GarbleDetector, Strategy
+
+
+@pytest.fixture(scope="session")
+def detectors():
+    """One default-configured detector per word-level strategy, shared by
+    every test in the session."""
+    return {
+        strategy: GarbleDetector(strategy)
+        for strategy in (
+            Strategy.FUNCTION_WORD_DENSITY,
+            Strategy.AFFIX_DETECTION,
+            Strategy.ZIPF_CONFORMITY,
+            Strategy.WORD_COLLOCATION,
+        )
+    }
@@ -1,6 +1,9 @@
+import copy
+import pickle
+
 import pytest
 
-from pygarble import GarbleDetector, Strategy
+from pygarble import EnsembleDetector, GarbleDetector, Strategy
 
 
 class TestGarbleDetector:
@@ -68,6 +71,20 @@ class TestGarbleDetector:
         prediction = detector.predict("aaaaaaa")
         assert prediction == (proba >= 0.3)
 
+    def test_predict_with_proba_matches_separate_calls(self):
+        detector = GarbleDetector(Strategy.MARKOV_CHAIN, threshold=0.0)
+        for text in ["", "  ", "hello", "xkqzjwp"]:
+            assert detector.predict_with_proba(text) == (
+                detector.predict(text), detector.predict_proba(text)
+            )
+
+    def test_predict_with_proba_invalid_input(self):
+        detector = GarbleDetector(Strategy.WORD_LOOKUP)
+        with pytest.raises(TypeError):
+            detector.predict_with_proba(123)
+        with pytest.raises(TypeError):
+            detector.predict_with_proba(["a list", "of texts"])
+
     def test_not_implemented_strategy(self):
         from enum import Enum
 
@@ -76,3 +93,20 @@ class TestGarbleDetector:
 
         with pytest.raises(NotImplementedError):
             GarbleDetector(UnsupportedStrategy.UNSUPPORTED)
+
+    def test_pickle_round_trip(self):
+        text = "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt"
+        for detector in (
+            GarbleDetector(Strategy.FUNCTION_WORD_DENSITY),
+            EnsembleDetector(),
+        ):
+            expected = detector.predict_proba(text)
+            restored = pickle.loads(pickle.dumps(detector))
+            assert restored.predict_proba(text) == expected
+
+    def test_deepcopy_has_its_own_cache(self):
+        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
+        clone = copy.deepcopy(detector)
+        clone.predict_proba("xkrf plmq bvzt nwsd jghc trbn")
+        assert clone._strategy_instance._proba_cache
+        assert not detector._strategy_instance._proba_cache
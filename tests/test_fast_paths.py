@@ -0,0 +1,298 @@
+"""Equivalence tests for the optimized code paths.
+
+Each fast path must produce exactly what the straightforward version it
+replaced did; these tests pin that contract.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+
+import pytest
+
+from pygarble import GarbleDetector, Strategy
+from pygarble._context import fold_diacritics, text_context
+from pygarble.strategies._fast_hist import ascii_alpha_histogram
+from pygarble.strategies._fast_tokenize import (
+    is_ascii_alpha_run,
+    tokenize_ascii,
+    tokenize_ascii_contractions,
+)
+from pygarble.strategies.affix_detection import AffixDetectionStrategy
+from pygarble.strategies.function_word_density import (
+    FunctionWordDensityStrategy,
+)
+from pygarble.strategies.word_collocation import WordCollocationStrategy
+from pygarble.strategies.zipf_conformity import ZipfConformityStrategy
+
+
+class TestTokenizeAscii:
+    """tokenize_ascii must match re.findall(r"[a-zA-Z]+", text.lower())."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "   ",
+        "The quick brown fox",
+        "HELLO, World! it's 42 o'clock",
+        '{"id": 12, "hash": "0xDEADbeef"}',
+        "café naïve über straße",
+        "K is the Kelvin sign",
+        "İstanbul",
+        "tab\tseparated\nlines",
+    ])
+    def test_matches_regex(self, text):
+        expected = re.findall(r"[a-zA-Z]+", text.lower())
+        assert tokenize_ascii(text) == expected
+
+
+class TestAffixTrie:
+    """The trie walk must accept exactly the words the linear
+    startswith/endswith scan accepted."""
+
+    WORDS = [
+        "understand", "undertow", "unzx", "rewrite", "prefix", "antiqxz",
+        "nation", "quickly", "ly", "fly", "water", "zxqwer", "counterpart",
+        "transmission", "seriously", "xkrfm", "supermarket", "bbbtion",
+        "over", "under", "able",
+    ]
+
+    @staticmethod
+    def _linear_has_affix(strategy, word):
+        for prefix in strategy.PREFIXES:
+            stem = word[len(prefix):]
+            if (
+                word.startswith(prefix)
+                and len(stem) >= strategy.min_stem_length
+                and strategy._plausible_stem(stem)
+            ):
+                return True
+        for suffix in strategy.SUFFIXES:
+            stem = word[:-len(suffix)]
+            if (
+                word.endswith(suffix)
+                and len(stem) >= strategy.min_stem_length
+                and strategy._plausible_stem(stem)
+            ):
+                return True
+        return False
+
+    @pytest.mark.parametrize("min_stem_length", [-1, 0, 2, 4])
+    def test_matches_linear_scan(self, min_stem_length):
+        strategy = AffixDetectionStrategy(min_stem_length=min_stem_length)
+        for word in self.WORDS:
+            assert strategy._has_affix(word) == self._linear_has_affix(
+                strategy, word
+            ), word
+
+
+class TestAsciiAlphaHistogram:
+    """The count-pass histogram must equal the per-character Counter."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "Hello, World!",
+        "The Quick Brown Fox jumps over 13 lazy dogs. " * 10,
+        "0x1f 0x2e ZZZZ zzzz",
+    ])
+    def test_matches_counter(self, text):
+        expected = Counter(c for c in text.lower() if c.isalpha())
+        assert ascii_alpha_histogram(text) == expected
+
+
+class TestCollocationEarlyExit:
+    """Stopping at the first decisive hit must not change the score."""
+
+    GARBLED = "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt " * 6
+
+    def test_sparse_hit_in_long_text_still_scored(self):
+        strategy = WordCollocationStrategy()
+        # 1 hit in ~120 bigrams is below the 2% rate
+        assert strategy.predict_proba(
+            self.GARBLED + "of the " + self.GARBLED
+        ) == 0.55
+
+    def test_single_hit_clears_short_text(self):
+        strategy = WordCollocationStrategy()
+        assert strategy.predict_proba(
+            "xkrf plmq bvzt of the nwsd jghc trbn mkpl"
+        ) == 0.0
+
+
+class TestScoreCache:
+    """predict_proba memoizes per instance without changing scores."""
+
+    @staticmethod
+    def _count_scoring(strategy):
+        calls = []
+        impl = strategy._predict_proba_impl
+
+        def counted(text):
+            calls.append(text)
+            return impl(text)
+
+        strategy._predict_proba_impl = counted
+        return calls
+
+    def test_repeat_calls_hit_cache(self):
+        strategy = FunctionWordDensityStrategy()
+        calls = self._count_scoring(strategy)
+        text = "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt"
+        first = strategy.predict_proba(text)
+        assert strategy.predict_proba(text) == first
+        assert len(calls) == 1
+
+    def test_cache_can_be_disabled(self):
+        strategy = FunctionWordDensityStrategy(cache_size=0)
+        calls = self._count_scoring(strategy)
+        assert strategy.predict_proba("The cat sat on the mat") == 0.0
+        assert strategy.predict_proba("The cat sat on the mat") == 0.0
+        assert len(calls) == 2
+
+    def test_least_recently_used_evicted(self):
+        strategy = FunctionWordDensityStrategy(cache_size=2)
+        for text in ("one two", "three four", "one two", "five six"):
+            strategy.predict_proba(text)
+        assert list(strategy._proba_cache) == ["one two", "five six"]
+
+    def test_long_texts_not_cached(self):
+        strategy = FunctionWordDensityStrategy()
+        text = "the cat " * strategy.CACHE_MAX_TEXT_LENGTH
+        strategy.predict_proba(text)
+        assert not strategy._proba_cache
+
+    def test_detector_repeats_hit_strategy_cache(self):
+        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
+        calls = self._count_scoring(detector._strategy_instance)
+        text = "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt"
+        assert detector.predict(text) is True
+        assert detector.predict_proba(text) > 0.5
+        assert len(calls) == 1
+
+    def test_negative_cache_size_rejected(self):
+        with pytest.raises(ValueError):
+            FunctionWordDensityStrategy(cache_size=-1)
+
+
+class TestTokenizeAsciiContractions:
+    """Must match the stripped ``[a-zA-Z']+`` scan it replaced."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "'''",
+        "Don't you think it's the 'best' thing?",
+        "rock'n'roll ''quoted'' O'Brien's",
+        "naïve café isn't",
+        "K'",
+    ])
+    def test_matches_regex(self, text):
+        tokens = re.findall(r"[a-zA-Z']+", text.lower())
+        expected = [t.strip("'") for t in tokens if t.strip("'")]
+        assert tokenize_ascii_contractions(text) == expected
+
+
+class TestPredictProbaBatch:
+    """Batch scoring must match scoring each text on its own."""
+
+    TEXTS = ["", "The cat sat on the mat", "xkrf plmq bvzt nwsd jghc"]
+
+    def test_matches_per_text_scores(self):
+        strategy = FunctionWordDensityStrategy()
+        assert strategy.predict_proba_batch(self.TEXTS) == [
+            strategy.predict_proba(text) for text in self.TEXTS
+        ]
+
+    def test_detector_keeps_empty_text_clean(self):
+        detector = GarbleDetector(Strategy.MARKOV_CHAIN, threshold=0.0)
+        assert detector.predict(["", "  ", "hello"]) == [False, False, True]
+
+
+class TestIsAsciiAlphaRun:
+    """Must accept exactly the tokens made only of ASCII letters."""
+
+    @pytest.mark.parametrize("token", [
+        "", "hello", "HeLLo", "don't", "abc1", "café", "K", "a-b",
+    ])
+    def test_matches_regex(self, token):
+        expected = re.fullmatch(r"[a-zA-Z]+", token) is not None
+        assert is_ascii_alpha_run(token) == expected
+
+
+class TestZipfShortCircuit:
+    """The TTR bounds may only skip texts that would score 0.0."""
+
+    def test_repetitive_long_text_scores_zero(self):
+        text = "the cat sat on the mat and the dog lay on the rug " * 20
+        assert ZipfConformityStrategy().predict_proba(text) == 0.0
+
+    def test_all_unique_text_not_skipped_at_max_thresholds(self):
+        words = [
+            a + b + c for a in "bcdfg" for b in "aeiou" for c in "klmnp"
+        ]
+        strategy = ZipfConformityStrategy(
+            ttr_threshold=1.0, hapax_threshold=1.0
+        )
+        assert strategy.predict_proba(" ".join(words)) > 0.0
+
+
+class TestMinTextLength:
+    """The length guard may only skip texts with too few words."""
+
+    @pytest.mark.parametrize("cls", [
+        FunctionWordDensityStrategy,
+        AffixDetectionStrategy,
+        ZipfConformityStrategy,
+        WordCollocationStrategy,
+    ])
+    def test_shortest_qualifying_text_still_applicable(self, cls):
+        strategy = cls()
+        word = "q" * getattr(strategy, "min_word_length", 1)
+        count = getattr(
+            strategy, "min_analyzable_words", None
+        ) or strategy.min_words
+        text = " ".join([word] * count)
+        assert len(text) == strategy._min_length
+        assert strategy.applicable(text)
+        assert not strategy.applicable(text[1:])
+
+
+class TestTextContext:
+    """Per-text features are computed once and shared across strategies."""
+
+    @pytest.mark.parametrize("text", [
+        "", "plain ascii", "café naïve", "ﬁnal Ⅻ", "x\u0301",
+    ])
+    def test_fold_matches_nfkd(self, text):
+        normalized = unicodedata.normalize("NFKD", text)
+        expected = "".join(
+            c for c in normalized if not unicodedata.combining(c)
+        )
+        assert fold_diacritics(text) == expected
+
+    def test_strategies_share_one_context(self):
+        text = "The cat sat on the mat with the dog"
+        AffixDetectionStrategy().predict_proba(text)
+        words = text_context(text).words
+        ZipfConformityStrategy().predict_proba(text)
+        assert text_context(text).words is words
+
+    def test_collocation_tokens_shared(self):
+        text = "It's going to be a long day, isn't it?"
+        strategy = WordCollocationStrategy()
+        strategy.applicable(text)
+        words = text_context(text).contraction_words
+        assert words == (
+            "it's", "going", "to", "be", "a", "long", "day", "isn't", "it",
+        )
+        assert strategy._tokenize(text) is words
+
+    def test_disabled_cache_bypasses_shared_context(self):
+        text_context.cache_clear()
+        strategy = ZipfConformityStrategy(cache_size=0)
+        strategy.predict_proba("a text scored without any caching at all")
+        assert text_context.cache_info().currsize == 0
+
+    def test_long_text_bypasses_shared_context(self):
+        text_context.cache_clear()
+        strategy = ZipfConformityStrategy()
+        strategy.predict_proba("xkrf plmq " * strategy.CACHE_MAX_TEXT_LENGTH)
+        assert text_context.cache_info().currsize == 0
@@ -7,68 +7,109 @@ Tests for word-level strategies added in v0.6.0:
 """
 
 import pytest
-from pygarble import GarbleDetector, Strategy
+from pygarble import Strategy
+
+
+# Garbled inputs shared by several tests
+GARBLED_5 = "xkrf plmq bvzt nwsd jghc"
+GARBLED_10 = "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt"
+GARBLED_12 = "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt qzml hkrp"
+
+# 35 unique all-alpha garbled words
+GARBLED_35_WORDS = (
+    "xkrf", "plmq", "bvzt", "nwsd", "jghc",
+    "trbn", "mkpl", "wqzd", "lpnr", "fvxt",
+    "qzml", "hkrp", "bntw", "xvfd", "cjmg",
+    "rlwp", "gthx", "znkm", "vbqf", "djsr",
+    "xtlw", "npfz", "mkcb", "ghvr", "wjqt",
+    "bfrk", "nlgz", "xpcm", "hvtq", "dwrj",
+    "ktsg", "fmqb", "zxwn", "pljr", "cvdh",
+)
+GARBLED_35 = " ".join(GARBLED_35_WORDS)
+
+# Natural text with repeated function words
+NATURAL_TEXT = (
+    "The cat sat on the mat and the dog lay on the rug "
+    "by the fire in the warm room near the big chair"
+)
+
+
+# Views onto the session-wide detectors (see conftest.py), so a strategy
+# used by several classes is still only built once.
+@pytest.fixture(scope="module")
+def fwd_detector(detectors):
+    return detectors[Strategy.FUNCTION_WORD_DENSITY]
+
+
+@pytest.fixture(scope="module")
+def affix_detector(detectors):
+    return detectors[Strategy.AFFIX_DETECTION]
+
+
+@pytest.fixture(scope="module")
+def zipf_detector(detectors):
+    return detectors[Strategy.ZIPF_CONFORMITY]
+
+
+@pytest.fixture(scope="module")
+def collocation_detector(detectors):
+    return detectors[Strategy.WORD_COLLOCATION]
+
+
+@pytest.fixture(scope="module", params=[
+    Strategy.FUNCTION_WORD_DENSITY,
+    Strategy.WORD_COLLOCATION,
+], ids=lambda strategy: strategy.value)
+def valid_text_detector(request, detectors):
+    return detectors[request.param]
 
 
 class TestFunctionWordDensityStrategy:
     """Tests for function word density detection."""
 
-    def test_valid_english_text(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        assert detector.predict("The cat sat on the mat") is False
-        assert detector.predict("I have been to the store") is False
-        assert detector.predict("She was reading a book in the library") is False
+    def test_valid_english_text(self, fwd_detector):
+        results = fwd_detector.predict([
+            "The cat sat on the mat",
+            "I have been to the store",
+            "She was reading a book in the library",
+        ])
+        assert results == [False, False, False]
 
-    def test_garbled_text(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        assert detector.predict(
-            "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt"
-        ) is True
+    def test_garbled_text(self, fwd_detector):
+        assert fwd_detector.predict(GARBLED_10) is True
 
-    def test_short_text_exempt(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
+    def test_short_text_exempt(self, fwd_detector):
         # Fewer than 5 words -> exempt
-        assert detector.predict("hello world") is False
-        assert detector.predict("xkrf plmq bvzt") is False
-
-    def test_all_caps(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        assert detector.predict("THE CAT SAT ON THE MAT AND THE DOG") is False
-
-    def test_probability_range(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        for text in ["The cat sat on the mat", "xkrf plmq bvzt nwsd jghc"]:
-            proba = detector.predict_proba(text)
-            assert 0.0 <= proba <= 1.0
-
-    def test_valid_text_low_probability(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        proba = detector.predict_proba(
+        assert fwd_detector.predict("hello world") is False
+        assert fwd_detector.predict("xkrf plmq bvzt") is False
+
+    def test_all_caps(self, fwd_detector):
+        assert fwd_detector.predict(
+            "THE CAT SAT ON THE MAT AND THE DOG"
+        ) is False
+
+    def test_valid_text_low_probability(self, fwd_detector):
+        flag, proba = fwd_detector.predict_with_proba(
             "The quick brown fox jumps over the lazy dog"
         )
+        assert flag is False
         assert proba < 0.5
 
-    def test_garbled_high_probability(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        proba = detector.predict_proba(
-            "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt"
-        )
+    def test_garbled_high_probability(self, fwd_detector):
+        proba = fwd_detector.predict_proba(GARBLED_10)
         assert proba > 0.5
 
-    def test_empty_string(self):
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        assert detector.predict("") is False
-        assert detector.predict_proba("") == 0.0
+    def test_empty_string(self, fwd_detector):
+        assert fwd_detector.predict("") is False
+        assert fwd_detector.predict_proba("") == 0.0
 
-    def test_technical_short_text(self):
+    def test_technical_short_text(self, fwd_detector):
         """Short technical text should not be flagged."""
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        assert detector.predict("HTTP API REST") is False
+        assert fwd_detector.predict("HTTP API REST") is False
 
-    def test_text_with_some_function_words(self):
+    def test_text_with_some_function_words(self, fwd_detector):
         """Text with even a few function words should pass."""
-        detector = GarbleDetector(Strategy.FUNCTION_WORD_DENSITY)
-        proba = detector.predict_proba(
+        proba = fwd_detector.predict_proba(
             "Python is a great programming language for data science"
         )
         assert proba < 0.5
@@ -77,52 +118,40 @@ class TestFunctionWordDensityStrategy:
 class TestAffixDetectionStrategy:
     """Tests for affix detection."""
 
-    def test_valid_english_text(self):
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
-        assert detector.predict(
+    def test_valid_english_text(self, affix_detector):
+        assert affix_detector.predict(
             "The programming language is incredibly powerful and usable"
         ) is False
 
-    def test_short_text_exempt(self):
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
-        assert detector.predict("cat dog run") is False
-        assert detector.predict("xkrf plmq") is False
+    def test_short_text_exempt(self, affix_detector):
+        assert affix_detector.predict("cat dog run") is False
+        assert affix_detector.predict("xkrf plmq") is False
 
-    def test_short_words_exempt(self):
+    def test_short_words_exempt(self, affix_detector):
         """Words shorter than min_word_length should be excluded."""
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
         # All words < 4 chars -> no analyzable words -> exempt
-        assert detector.predict("cat dog run sit eat the and") is False
-
-    def test_probability_range(self):
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
-        for text in ["understanding programming", "xkrf plmq bvzt nwsd"]:
-            proba = detector.predict_proba(text)
-            assert 0.0 <= proba <= 1.0
+        assert affix_detector.predict("cat dog run sit eat the and") is False
 
-    def test_empty_string(self):
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
-        assert detector.predict("") is False
-        assert detector.predict_proba("") == 0.0
+    def test_empty_string(self, affix_detector):
+        assert affix_detector.predict("") is False
+        assert affix_detector.predict_proba("") == 0.0
 
-    def test_words_with_affixes_pass(self):
+    def test_words_with_affixes_pass(self, affix_detector):
         """Text with common affixes should not be flagged."""
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
-        proba = detector.predict_proba(
+        proba = affix_detector.predict_proba(
             "The unbelievable transformation was incredibly"
             " powerful and meaningful for everyone involved"
         )
         assert proba < 0.5
 
-    def test_garbled_long_words(self):
+    def test_garbled_long_words(self, affix_detector):
         """Many long garbled words without affixes should be flagged.
 
         Zero affixes is a weak signal on its own (legitimate name lists
         also lack affixes), so it only reaches the decision threshold
         with 20+ analyzable words.
         """
-        detector = GarbleDetector(Strategy.AFFIX_DETECTION)
-        proba = detector.predict_proba(
+        proba = affix_detector.predict_proba(
             "xkrfm plmqn bvztk nwsdr jghcm"
             " trbnp mkplw wqzdl lpnrx fvxtb"
             " qzvxm wplkt nbrfd gxzcq hjklv"
@@ -134,120 +163,77 @@ class TestAffixDetectionStrategy:
 class TestZipfConformityStrategy:
     """Tests for Zipf's law conformity detection."""
 
-    def test_valid_long_text(self):
-        detector = GarbleDetector(Strategy.ZIPF_CONFORMITY)
-        # Natural text with repeated function words
-        text = (
-            "The cat sat on the mat and the dog lay on the rug "
-            "by the fire in the warm room near the big chair"
-        )
-        assert detector.predict(text) is False
+    def test_valid_long_text(self, zipf_detector):
+        assert zipf_detector.predict(NATURAL_TEXT) is False
 
-    def test_short_text_exempt(self):
-        detector = GarbleDetector(Strategy.ZIPF_CONFORMITY)
-        assert detector.predict("hello world") is False
-        assert detector.predict("short text here") is False
+    def test_short_text_exempt(self, zipf_detector):
+        assert zipf_detector.predict("hello world") is False
+        assert zipf_detector.predict("short text here") is False
 
-    def test_probability_range(self):
-        detector = GarbleDetector(Strategy.ZIPF_CONFORMITY)
-        text = (
-            "The cat sat on the mat and the dog lay on the rug "
-            "by the fire in the warm room near the big chair"
-        )
-        proba = detector.predict_proba(text)
-        assert 0.0 <= proba <= 1.0
-
-    def test_empty_string(self):
-        detector = GarbleDetector(Strategy.ZIPF_CONFORMITY)
-        assert detector.predict("") is False
-        assert detector.predict_proba("") == 0.0
+    def test_empty_string(self, zipf_detector):
+        assert zipf_detector.predict("") is False
+        assert zipf_detector.predict_proba("") == 0.0
 
-    def test_all_unique_words_flagged(self):
+    def test_all_unique_words_flagged(self, zipf_detector):
         """30+ unique random words should be flagged."""
-        detector = GarbleDetector(Strategy.ZIPF_CONFORMITY)
-        # 35 unique all-alpha garbled words
-        words = [
-            "xkrf", "plmq", "bvzt", "nwsd", "jghc",
-            "trbn", "mkpl", "wqzd", "lpnr", "fvxt",
-            "qzml", "hkrp", "bntw", "xvfd", "cjmg",
-            "rlwp", "gthx", "znkm", "vbqf", "djsr",
-            "xtlw", "npfz", "mkcb", "ghvr", "wjqt",
-            "bfrk", "nlgz", "xpcm", "hvtq", "dwrj",
-            "ktsg", "fmqb", "zxwn", "pljr", "cvdh",
-        ]
-        proba = detector.predict_proba(" ".join(words))
+        proba = zipf_detector.predict_proba(GARBLED_35)
         assert proba > 0.5
 
-    def test_repeated_text_not_flagged(self):
+    def test_repeated_text_not_flagged(self, zipf_detector):
         """Text with natural word repetition should pass."""
-        detector = GarbleDetector(Strategy.ZIPF_CONFORMITY)
         text = (
             "the the the the the a a a a is is is "
             "and and or or but the a the is and the"
         )
-        proba = detector.predict_proba(text)
+        proba = zipf_detector.predict_proba(text)
         assert proba < 0.5
 
 
 class TestWordCollocationStrategy:
     """Tests for word collocation detection."""
 
-    def test_valid_english_text(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        assert detector.predict(
+    def test_valid_english_text(self, collocation_detector):
+        assert collocation_detector.predict(
             "It is going to be a long day for the team"
         ) is False
 
-    def test_short_text_exempt(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        assert detector.predict("hello world") is False
-        assert detector.predict("xkrf plmq") is False
-
-    def test_garbled_text(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        assert detector.predict(
-            "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt qzml hkrp"
-        ) is True
-
-    def test_probability_range(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        for text in [
-            "It is going to be a long day",
-            "xkrf plmq bvzt nwsd jghc",
-        ]:
-            proba = detector.predict_proba(text)
-            assert 0.0 <= proba <= 1.0
-
-    def test_valid_text_low_probability(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        proba = detector.predict_proba(
+    def test_short_text_exempt(self, collocation_detector):
+        assert collocation_detector.predict("hello world") is False
+        assert collocation_detector.predict("xkrf plmq") is False
+
+    def test_garbled_text(self, collocation_detector):
+        assert collocation_detector.predict(GARBLED_12) is True
+
+    def test_long_garbled_text(self, collocation_detector):
+        assert collocation_detector.predict(GARBLED_35) is True
+
+    def test_valid_text_low_probability(self, collocation_detector):
+        flag, proba = collocation_detector.predict_with_proba(
             "The cat sat on the mat in the room"
         )
+        assert flag is False
         assert proba < 0.5
 
-    def test_garbled_high_probability(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        proba = detector.predict_proba(
-            "xkrf plmq bvzt nwsd jghc trbn mkpl wqzd lpnr fvxt qzml hkrp"
-        )
+    def test_garbled_high_probability(self, collocation_detector):
+        proba = collocation_detector.predict_proba(GARBLED_12)
         assert proba > 0.5
 
-    def test_empty_string(self):
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        assert detector.predict("") is False
-        assert detector.predict_proba("") == 0.0
+    def test_empty_string(self, collocation_detector):
+        assert collocation_detector.predict("") is False
+        assert collocation_detector.predict_proba("") == 0.0
 
-    def test_short_garbled_below_threshold(self):
+    def test_short_garbled_below_threshold(self, collocation_detector):
         """Short garbled text should score below 0.5."""
-        detector = GarbleDetector(Strategy.WORD_COLLOCATION)
-        proba = detector.predict_proba("xkrf plmq bvzt nwsd jghc trbn mkpl")
+        proba = collocation_detector.predict_proba(
+            "xkrf plmq bvzt nwsd jghc trbn mkpl"
+        )
         assert proba < 0.5
 
 
 class TestHighPrecisionWordLevel:
     """Ensure no false positives on valid English text."""
 
-    VALID_TEXTS = [
+    VALID_TEXTS = (
         "The quick brown fox jumps over the lazy dog",
         "Python is a great programming language",
         "I have been to the store and back again",
@@ -258,27 +244,43 @@ class TestHighPrecisionWordLevel:
         "He said that he would be there on time",
         "Natural language processing is fascinating",
         "The best way to learn is by doing it yourself",
-    ]
-
-    @pytest.mark.parametrize("strategy", [
-        Strategy.FUNCTION_WORD_DENSITY,
-        Strategy.WORD_COLLOCATION,
-    ])
-    def test_no_false_positives(self, strategy):
-        detector = GarbleDetector(strategy)
-        for text in self.VALID_TEXTS:
-            assert detector.predict(text) is False, (
-                f"{strategy.value} flagged valid text: {text!r}"
-            )
-
-    @pytest.mark.parametrize("strategy", [
-        Strategy.FUNCTION_WORD_DENSITY,
-        Strategy.WORD_COLLOCATION,
-    ])
-    def test_low_probability_on_valid(self, strategy):
-        detector = GarbleDetector(strategy)
-        for text in self.VALID_TEXTS:
-            proba = detector.predict_proba(text)
-            assert proba < 0.5, (
-                f"{strategy.value} gave {proba:.2f} for: {text!r}"
-            )
+    )
+
+    @pytest.mark.parametrize("text", VALID_TEXTS)
+    def test_no_false_positives(self, valid_text_detector, text):
+        detector = valid_text_detector
+        assert detector.predict(text) is False, (
+            f"{detector.strategy.value} flagged valid text: {text!r}"
+        )
+
+    def test_low_probability_on_valid(self, valid_text_detector):
+        detector = valid_text_detector
+        # One list call scores the whole batch
+        probas = detector.predict_proba(list(self.VALID_TEXTS))
+        # Report every offending text, not just the first
+        failing = [
+            (text, round(proba, 2))
+            for text, proba in zip(self.VALID_TEXTS, probas)
+            if proba >= 0.5
+        ]
+        assert not failing, f"{detector.strategy.value}: {failing}"
+
+
+# (strategy, text) pairs whose score must be a probability
+RANGE_CASES = [
+    (Strategy.FUNCTION_WORD_DENSITY, "The cat sat on the mat"),
+    (Strategy.FUNCTION_WORD_DENSITY, GARBLED_5),
+    (Strategy.AFFIX_DETECTION, "understanding programming"),
+    (Strategy.AFFIX_DETECTION, "xkrf plmq bvzt nwsd"),
+    (Strategy.ZIPF_CONFORMITY, NATURAL_TEXT),
+    (Strategy.ZIPF_CONFORMITY, GARBLED_35),
+    (Strategy.WORD_COLLOCATION, "It is going to be a long day"),
+    (Strategy.WORD_COLLOCATION, GARBLED_5),
+]
+
+
+@pytest.mark.parametrize("strategy,text", RANGE_CASES)
+def test_probability_range(detectors, strategy, text):
+    flag, proba = detectors[strategy].predict_with_proba(text)
+    assert 0.0 <= proba <= 1.0, proba
+    assert flag is (proba >= 0.5)